@@ -1,5 +1,30 @@
 """Useful dictionaries to have around for bioinformatics."""
 
+import collections.abc
+import itertools
+import types
+
+__all__ = ['aa', 'aa_3_to_1', 'bases', 'codon_list', 'amino_acids', 'codons',
+           'translate_codon']
+
+
+class _UpperKeyMapping(collections.abc.Mapping):
+    """Read-only mapping that uppercases keys on lookup, so only the
+    uppercase variant of each key needs to be stored."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key.upper()]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+
 aa = {'A': 'Ala',
       'R': 'Arg',
       'N': 'Asn',
@@ -20,8 +45,12 @@ aa = {'A': 'Ala',
       'W': 'Trp',
       'Y': 'Tyr',
       'V': 'Val'}
+aa = types.MappingProxyType(aa)
 
-aa_3_to_1 = {'ALA': 'A',
+# Only uppercase keys are stored; lookups of 'Ala', 'ala', etc. are
+# uppercased by the mapping, keeping the table a third of the size
+aa_3_to_1 = _UpperKeyMapping(
+            {'ALA': 'A',
              'ARG': 'R',
              'ASN': 'N',
              'ASP': 'D',
@@ -40,62 +69,50 @@ aa_3_to_1 = {'ALA': 'A',
              'THR': 'T',
              'TRP': 'W',
              'TYR': 'Y',
-             'VAL': 'V',
-             'Ala': 'A',
-             'Arg': 'R',
-             'Asn': 'N',
-             'Asp': 'D',
-             'Cys': 'C',
-             'Gln': 'Q',
-             'Glu': 'E',
-             'Gly': 'G',
-             'His': 'H',
-             'Ile': 'I',
-             'Leu': 'L',
-             'Lys': 'K',
-             'Met': 'M',
-             'Phe': 'F',
-             'Pro': 'P',
-             'Ser': 'S',
-             'Thr': 'T',
-             'Trp': 'W',
-             'Tyr': 'Y',
-             'Val': 'V',
-             'ala': 'A',
-             'arg': 'R',
-             'asn': 'N',
-             'asp': 'D',
-             'cys': 'C',
-             'gln': 'Q',
-             'glu': 'E',
-             'gly': 'G',
-             'his': 'H',
-             'ile': 'I',
-             'leu': 'L',
-             'lys': 'K',
-             'met': 'M',
-             'phe': 'F',
-             'pro': 'P',
-             'ser': 'S',
-             'thr': 'T',
-             'trp': 'W',
-             'tyr': 'Y',
-             'val': 'V'}
+             'VAL': 'V'})
 
 
 # The set of DNA bases
 bases = ['T', 'C', 'A', 'G']
 
-# Build list of codons
-codon_list = []
-for first_base in bases:
-    for second_base in bases:
-        for third_base in bases:
-            codon_list += [first_base + second_base + third_base]
+# Build list of codons; product preserves T, C, A, G order
+codon_list = [''.join(c) for c in itertools.product(bases, repeat=3)]
 
 # The amino acids that are coded for (* = STOP codon)
 amino_acids = 'FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG'
 
 # Build dictionary from tuple of 2-tuples (technically an iterator, but it works)
-codons = dict(zip(codon_list, amino_acids))
+codons = types.MappingProxyType(dict(zip(codon_list, amino_acids)))
+
+# Perfect-hash codon table: mapping bases A/C/G/T to 0..3 makes
+# (b1 << 4) | (b2 << 2) | b3 a unique index into a 64-entry bytes table
+_BASE_INDEX = {'A': 0, 'C': 1, 'G': 2, 'T': 3}
+
+_codon_table = bytearray(64)
+for _codon, _aa in codons.items():
+    _codon_table[(_BASE_INDEX[_codon[0]] << 4)
+                 | (_BASE_INDEX[_codon[1]] << 2)
+                 | _BASE_INDEX[_codon[2]]] = ord(_aa)
+_CODON_TABLE = bytes(_codon_table)
+del _codon_table, _codon, _aa
+
+
+def translate_codon(codon):
+    """
+    Translate a single DNA codon into its amino acid.
+
+    Parameters
+    ----------
+    codon : str
+        Three-letter DNA codon, e.g. 'ATG'. Case insensitive.
+
+    Returns
+    -------
+    str
+        One-letter amino acid code ('*' for a STOP codon).
+    """
+    codon = codon.upper()
+    return chr(_CODON_TABLE[(_BASE_INDEX[codon[0]] << 4)
+                            | (_BASE_INDEX[codon[1]] << 2)
+                            | _BASE_INDEX[codon[2]]])
 
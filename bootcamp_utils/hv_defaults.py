@@ -1,11 +1,32 @@
-import bokeh.palettes
-import colorcet
-import holoviews as hv
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def _palettes():
+    """Palette definitions, built on first use so that importing this
+    module does not pay for bokeh.palettes and colorcet."""
+    import bokeh.palettes
+    import colorcet
+
+    return dict(
+        datashader_blues=bokeh.palettes.Blues9[:6][::-1],
+        datashader_greys=bokeh.palettes.Greys9[:6][::-1],
+        datashader_purples=bokeh.palettes.Purples9[:6][::-1],
+        datashader_reds=bokeh.palettes.Reds9[:6][::-1],
+        default_categorical_cmap=colorcet.b_glasbey_category10,
+        default_sequential_cmap=list(bokeh.palettes.Viridis256),
+        default_diverging_cmap=colorcet.b_diverging_bwr_20_95_c54,
+    )
+
 
-datashader_blues = bokeh.palettes.Blues9[:6][::-1]
-datashader_greys = bokeh.palettes.Greys9[:6][::-1]
-datashader_purples = bokeh.palettes.Purples9[:6][::-1]
-datashader_reds = bokeh.palettes.Reds9[:6][::-1]
+def __getattr__(name):
+    """Lazily expose the palette constants as module attributes."""
+    palettes = _palettes()
+    if name in palettes:
+        return palettes[name]
+    raise AttributeError(
+        "module {0!r} has no attribute {1!r}".format(__name__, name)
+    )
 
 
 def no_xgrid_hook(plot, element):
@@ -29,18 +50,19 @@ def no_ygrid_hook(plot, element):
 #     "#bab0ac",
 # ]
 
-default_categorical_cmap = colorcet.b_glasbey_category10
-default_sequential_cmap = list(bokeh.palettes.Viridis256)
-default_diverging_cmap = colorcet.b_diverging_bwr_20_95_c54
 
+@functools.lru_cache(maxsize=None)
+def _default_opts():
+    """Option objects applied by `set_defaults()`, built once per
+    session instead of on every call."""
+    import holoviews as hv
 
-def set_defaults():
-    """
-    Set convenient HoloViews defaults
-    Called without arguments, sets default visual plotting options for
-    HoloViews.
-    """
-    hv.opts.defaults(
+    palettes = _palettes()
+    default_categorical_cmap = palettes["default_categorical_cmap"]
+    default_sequential_cmap = palettes["default_sequential_cmap"]
+    categorical_cycle = hv.Cycle(default_categorical_cmap)
+
+    return (
         hv.opts.Bars(
             alpha=0.9,
             bar_width=0.6,
@@ -56,10 +78,7 @@ def set_defaults():
             show_legend=False,
             width=450,
             ylim=(0, None),
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.BoxWhisker(
             box_cmap=default_categorical_cmap,
             box_fill_alpha=0.75,
@@ -81,12 +100,9 @@ def set_defaults():
             whisker_color="#222222",
             whisker_line_width=1,
             width=450,
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Curve(
-            color=hv.Cycle(default_categorical_cmap),
+            color=categorical_cycle,
             height=350,
             line_width=2,
             line_join="bevel",
@@ -95,21 +111,14 @@ def set_defaults():
             show_grid=True,
             toolbar="above",
             width=450,
-        )
-    )
-
-    hv.opts.defaults(hv.opts.HeatMap(cmap=default_sequential_cmap))
-
-    hv.opts.defaults(
+        ),
+        hv.opts.HeatMap(cmap=default_sequential_cmap),
         hv.opts.HexTiles(
             cmap=default_sequential_cmap, padding=0.05, show_grid=True, toolbar="above"
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Histogram(
             fill_alpha=0.3,
-            fill_color=hv.Cycle(default_categorical_cmap),
+            fill_color=categorical_cycle,
             height=450,
             line_alpha=0,
             line_width=2,
@@ -120,12 +129,8 @@ def set_defaults():
             toolbar="above",
             width=500,
             ylim=(0, None),
-        )
-    )
-
-    hv.opts.defaults(hv.opts.Image(cmap=default_sequential_cmap))
-
-    hv.opts.defaults(
+        ),
+        hv.opts.Image(cmap=default_sequential_cmap),
         hv.opts.NdOverlay(
             click_policy="hide",
             fontsize=dict(legend=8, title=12),
@@ -138,10 +143,7 @@ def set_defaults():
             show_title=True,
             toolbar="above",
             width=450,
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Overlay(
             click_policy="hide",
             fontsize=dict(legend=8),
@@ -154,12 +156,9 @@ def set_defaults():
             show_title=True,
             toolbar="above",
             width=450,
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Path(
-            color=hv.Cycle(default_categorical_cmap),
+            color=categorical_cycle,
             height=350,
             line_width=2,
             line_join="bevel",
@@ -168,14 +167,11 @@ def set_defaults():
             show_grid=True,
             toolbar="above",
             width=450,
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Points(
             alpha=0.75,
             cmap=default_categorical_cmap,
-            color=hv.Cycle(default_categorical_cmap),
+            color=categorical_cycle,
             fontsize=dict(legend=8),
             height=350,
             legend_offset=(10, 100),
@@ -186,14 +182,11 @@ def set_defaults():
             size=4,
             toolbar="above",
             width=450,
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Scatter(
             alpha=0.75,
             cmap=default_categorical_cmap,
-            color=hv.Cycle(default_categorical_cmap),
+            color=categorical_cycle,
             fontsize=dict(legend=8),
             height=350,
             legend_offset=(10, 100),
@@ -204,13 +197,10 @@ def set_defaults():
             size=4,
             toolbar="above",
             width=450,
-        )
-    )
-
-    hv.opts.defaults(
+        ),
         hv.opts.Spikes(
             cmap=default_categorical_cmap,
-            color=hv.Cycle(default_categorical_cmap),
+            color=categorical_cycle,
             fontsize=dict(legend=8),
             height=350,
             hooks=[no_xgrid_hook],
@@ -220,5 +210,16 @@ def set_defaults():
             show_grid=True,
             toolbar="above",
             width=450,
-        )
+        ),
     )
+
+
+def set_defaults():
+    """
+    Set convenient HoloViews defaults
+    Called without arguments, sets default visual plotting options for
+    HoloViews.
+    """
+    import holoviews as hv
+
+    hv.opts.defaults(*_default_opts())
@@ -2,6 +2,55 @@
 Utilities for parsing nucleic acid sequences.
 """
 
+import numpy as np
+
+from .bioinfo_dicts import _BASE_INDEX, _CODON_TABLE
+
+__all__ = ['translate', 'dna_to_rna', 'reverse_rna_complement']
+
+# Map ASCII base codes (either case) to the 2-bit values used to index
+# the perfect-hash codon table; all other bytes get a 255 sentinel so
+# invalid bases are caught
+_BASE_LUT = np.full(256, 255, dtype=np.uint8)
+for _base, _val in _BASE_INDEX.items():
+    _BASE_LUT[ord(_base)] = _val
+    _BASE_LUT[ord(_base.lower())] = _val
+del _base, _val
+
+_CODON_ARR = np.frombuffer(_CODON_TABLE, dtype=np.uint8)
+
+
+def translate(seq):
+    """
+    Translate a DNA sequence into protein.
+
+    Parameters
+    ----------
+    seq : str
+        DNA sequence consisting of A, C, G, and T, either case. The
+        length must be a multiple of three.
+
+    Returns
+    -------
+    str
+        Protein sequence in one-letter amino acid codes, with '*' for
+        STOP codons.
+    """
+
+    if len(seq) % 3 != 0:
+        raise RuntimeError('Sequence length must be a multiple of three.')
+
+    # Convert bases to 2-bit values, one codon per row
+    b = _BASE_LUT[np.frombuffer(seq.encode('ascii'), np.uint8)]
+    if (b > 3).any():
+        raise RuntimeError('Sequence contains bases other than A, C, G, and T.')
+    b = b.reshape(-1, 3)
+
+    # Perfect-hash index of each codon, then look up amino acids
+    idx = (b[:, 0] << 4) | (b[:, 1] << 2) | b[:, 2]
+    return _CODON_ARR[idx].tobytes().decode('ascii')
+
+
 def dna_to_rna(seq):
     """
     Convert a DNA sequence to RNA.
@@ -1,12 +1,104 @@
 import warnings
 
 import numpy as np
-import skimage
 
 import bokeh.models
 import bokeh.palettes
 import bokeh.plotting
 
+# Default palette for intensity images, built once at import
+_DEFAULT_PALETTE = tuple(bokeh.palettes.viridis(256))
+
+# Two-digit lowercase hex strings for all byte values
+_HEX = tuple("{0:02x}".format(i) for i in range(256))
+
+# String color mapper names for merging color images
+_MERGE_CMY = {"cmy": True, "rgb": False}
+
+try:
+    import numba
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+
+if _NUMBA_AVAILABLE:
+
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _rgba32_kernel(im, out, start, step):
+        """Fused scale/bit-pack/flip kernel for `rgb_to_rgba32`. Rows
+        are read from `start` with stride `step`, so a vertical flip is
+        `start=n-1, step=-1`."""
+        n = im.shape[0]
+        m = im.shape[1]
+        for i in numba.prange(n):
+            src = start + step * i
+            for j in range(m):
+                r = np.uint32(im[src, j, 0] * 255.0 + 0.5)
+                g = np.uint32(im[src, j, 1] * 255.0 + 0.5)
+                b = np.uint32(im[src, j, 2] * 255.0 + 0.5)
+                out[i, j] = np.uint32(0xFF000000) | (b << 16) | (g << 8) | r
+
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _cmy_kernel(im_0, im_1, im_2, mn_0, inv_0, mn_1, inv_1, mn_2, inv_2, out):
+        """Fused scale and CMY composition for `im_merge`, returning
+        the per-channel maxima of `out`. An `inv` of zero marks a
+        channel with no dynamic range, which is thresholded at zero
+        instead of scaled."""
+        n = im_0.shape[0]
+        m = im_0.shape[1]
+        max_r = np.float32(0.0)
+        max_g = np.float32(0.0)
+        max_b = np.float32(0.0)
+        for i in numba.prange(n):
+            for j in range(m):
+                if inv_0 == np.float32(0.0):
+                    a = np.float32(1.0) if im_0[i, j] > 0 else np.float32(0.0)
+                else:
+                    a = (im_0[i, j] - mn_0) * inv_0
+                if inv_1 == np.float32(0.0):
+                    b = np.float32(1.0) if im_1[i, j] > 0 else np.float32(0.0)
+                else:
+                    b = (im_1[i, j] - mn_1) * inv_1
+                if inv_2 == np.float32(0.0):
+                    c = np.float32(1.0) if im_2[i, j] > 0 else np.float32(0.0)
+                else:
+                    c = (im_2[i, j] - mn_2) * inv_2
+                r = b + c
+                g = a + c
+                bl = a + b
+                out[i, j, 0] = r
+                out[i, j, 1] = g
+                out[i, j, 2] = bl
+                max_r = max(max_r, r)
+                max_g = max(max_g, g)
+                max_b = max(max_b, bl)
+        return max_r, max_g, max_b
+
+    @numba.njit(cache=True)
+    def _minmax(im):
+        """Fused single-pass computation of (min, max) of an array."""
+        mn = im.flat[0]
+        mx = im.flat[0]
+        for v in im.flat:
+            if v < mn:
+                mn = v
+            elif v > mx:
+                mx = v
+        return mn, mx
+
+    # Warm up the JIT on a tiny image so the first real call is fast
+    _rgba32_kernel(
+        np.zeros((1, 1, 3), dtype=np.float32), np.empty((1, 1), dtype=np.uint32), 0, 1
+    )
+
+else:
+
+    def _minmax(im):
+        """Compute (min, max) of an array."""
+        return im.min(), im.max()
+
 
 def imshow(
     im,
@@ -28,6 +120,7 @@ def imshow(
     min_intensity=None,
     max_intensity=None,
     display_clicks=False,
+    max_display_pixels=2_000_000,
 ):
     """
     Display an image in a Bokeh figure.
@@ -88,6 +181,12 @@ def imshow(
         If True, display clicks to the right of the plot using
         JavaScript. The clicks are not recorded nor stored, just
         printed.
+    max_display_pixels : int, default 2000000
+        Maximum number of pixels to send to the browser. Images with
+        more pixels are downsampled by an integer factor before
+        display, intensity images by strided slicing and color images
+        by local averaging. Axis coordinates are unaffected. If None,
+        images are never downsampled.
 
     Returns
     -------
@@ -109,49 +208,73 @@ def imshow(
     if im.dtype == bool:
         im = im.astype(np.uint8)
 
-    # If it's above 8-bit, convert to float
-    if im.max() > 255:
-        im = im.astype(float) / im.max()
+    # Ensure C-contiguity once, so downstream views and Bokeh
+    # serialization do not trigger hidden copies
+    im = np.ascontiguousarray(im)
+
+    # Downsample large images; browser transfer and canvas draw time
+    # dominate NumPy for big frames. Images of other dimensionality
+    # pass through to the RuntimeError below.
+    if (
+        max_display_pixels is not None
+        and im.ndim in (2, 3)
+        and im.shape[0] * im.shape[1] > max_display_pixels
+    ):
+        factor = int(
+            np.ceil(np.sqrt(im.shape[0] * im.shape[1] / max_display_pixels))
+        )
+        if im.ndim == 2:
+            im = im[::factor, ::factor]
+        else:
+            # Deferred import; skimage is only needed on this path
+            import skimage.transform
+
+            im = skimage.transform.downscale_local_mean(im, (factor, factor, 1))
+        interpixel_distance *= factor
+
+    # Single scan for the dynamic range; reused below
+    im_min, im_max = _minmax(im)
+
+    # If it's above 8-bit, rescale to float32 in a single multiply pass
+    if im_max > 255:
+        im = np.multiply(im, 1.0 / float(im_max), dtype=np.float32)
+        im_min = im_min / im_max
+        im_max = 1.0
+
+    # Lowercase a string color mapper once for dispatch
+    cm_name = color_mapper.lower() if isinstance(color_mapper, str) else None
 
     # Get color mapper
     if im.ndim == 2:
         if color_mapper is None:
-            color_mapper = bokeh.models.LinearColorMapper(bokeh.palettes.viridis(256))
-        elif type(color_mapper) == str and color_mapper.lower() in ["rgb", "cmy"]:
+            color_mapper = bokeh.models.LinearColorMapper(_DEFAULT_PALETTE)
+        elif cm_name in _MERGE_CMY:
             raise RuntimeError("Cannot use rgb or cmy colormap for intensity image.")
         if min_intensity is None:
-            color_mapper.low = im.min()
+            color_mapper.low = im_min
         else:
             color_mapper.low = min_intensity
         if max_intensity is None:
-            color_mapper.high = im.max()
+            color_mapper.high = im_max
         else:
             color_mapper.high = max_intensity
     elif im.ndim == 3:
-        if color_mapper is None or color_mapper.lower() == "cmy":
-            im = im_merge(
-                *np.rollaxis(im, 2),
-                cmy=True,
-                im_0_min=min_intensity,
-                im_1_min=min_intensity,
-                im_2_min=min_intensity,
-                im_0_max=max_intensity,
-                im_1_max=max_intensity,
-                im_2_max=max_intensity,
-            )
-        elif color_mapper.lower() == "rgb":
-            im = im_merge(
-                *np.rollaxis(im, 2),
-                cmy=False,
-                im_0_min=min_intensity,
-                im_1_min=min_intensity,
-                im_2_min=min_intensity,
-                im_0_max=max_intensity,
-                im_1_max=max_intensity,
-                im_2_max=max_intensity,
-            )
-        else:
+        if color_mapper is not None and cm_name not in _MERGE_CMY:
             raise RuntimeError("Invalid color mapper for color image.")
+
+        # Channel views of the contiguous image, as im_merge consumes them
+        channels = tuple(im[:, :, i] for i in range(im.shape[2]))
+        im = im_merge(
+            *channels,
+            cmy=_MERGE_CMY.get(cm_name, True),
+            im_0_min=min_intensity,
+            im_1_min=min_intensity,
+            im_2_min=min_intensity,
+            im_0_max=max_intensity,
+            im_1_max=max_intensity,
+            im_2_max=max_intensity,
+            out_dtype="uint8",
+        )
     else:
         raise RuntimeError("Input image array must have either 2 or 3 dimensions.")
 
@@ -259,6 +382,7 @@ def im_merge(
     im_1_min=None,
     im_2_min=None,
     cmy=True,
+    out_dtype=None,
 ):
     """
     Merge channels to make RGB image.
@@ -291,77 +415,135 @@ def im_merge(
         If True, first channel is cyan, second is magenta, and third is
         yellow. Otherwise, first channel is red, second is green, and
         third is blue.
+    out_dtype : str or Numpy dtype, default None
+        If None, the output is float with values between zero and one.
+        If 'uint8', the output is quantized to 8 bits, which
+        `rgb_to_rgba32` consumes directly and which halves the memory
+        footprint of the result.
 
     Returns
     -------
-    output : array_like, dtype float, shape (*im_0.shape, 3)
-        RGB image.
+    output : array_like, shape (*im_0.shape, 3)
+        RGB image, either float scaled to [0, 1] or uint8 scaled to
+        [0, 255] depending on `out_dtype`.
     """
 
+    if out_dtype is not None and np.dtype(out_dtype) != np.uint8:
+        raise RuntimeError("`out_dtype` must be None or 'uint8'.")
+
+    # Single fused scan per channel for both min and max
+    im_0_lo, im_0_hi = _minmax(im_0)
+    im_1_lo, im_1_hi = _minmax(im_1)
+    if im_2 is not None:
+        im_2_lo, im_2_hi = _minmax(im_2)
+
     # Compute max intensities if needed
     if im_0_max is None:
-        im_0_max = im_0.max()
+        im_0_max = im_0_hi
     if im_1_max is None:
-        im_1_max = im_1.max()
+        im_1_max = im_1_hi
     if im_2 is not None and im_2_max is None:
-        im_2_max = im_2.max()
+        im_2_max = im_2_hi
 
     # Compute min intensities if needed
     if im_0_min is None:
-        im_0_min = im_0.min()
+        im_0_min = im_0_lo
     if im_1_min is None:
-        im_1_min = im_1.min()
+        im_1_min = im_1_lo
     if im_2 is not None and im_2_min is None:
-        im_2_min = im_2.min()
+        im_2_min = im_2_lo
 
     # Make sure maxes are ok
     if (
-        im_0_max < im_0.max()
-        or im_1_max < im_1.max()
-        or (im_2 is not None and im_2_max < im_2.max())
+        im_0_max < im_0_hi
+        or im_1_max < im_1_hi
+        or (im_2 is not None and im_2_max < im_2_hi)
     ):
         raise RuntimeError("Inputted max of channel < max of inputted channel.")
 
     # Make sure mins are ok
     if (
-        im_0_min > im_0.min()
-        or im_1_min > im_1.min()
-        or (im_2 is not None and im_2_min > im_2.min())
+        im_0_min > im_0_lo
+        or im_1_min > im_1_lo
+        or (im_2 is not None and im_2_min > im_2_lo)
     ):
         raise RuntimeError("Inputted min of channel > min of inputted channel.")
 
-    # Scale the images
+    # Fused Numba path: scale, compose, and find the channel maxima in
+    # one pass over the pixels, then normalize
+    if cmy and _NUMBA_AVAILABLE:
+        inv_0 = 1.0 / (im_0_max - im_0_min) if im_0_max > im_0_min else 0.0
+        inv_1 = 1.0 / (im_1_max - im_1_min) if im_1_max > im_1_min else 0.0
+        if im_2 is None:
+            im_2 = np.zeros(np.shape(im_0), dtype=np.float32)
+            im_2_min = 0.0
+            inv_2 = 0.0
+        else:
+            inv_2 = 1.0 / (im_2_max - im_2_min) if im_2_max > im_2_min else 0.0
+
+        im_rgb = np.empty((*np.shape(im_0), 3), dtype=np.float32)
+        max_rgb = _cmy_kernel(
+            np.ascontiguousarray(im_0, dtype=np.float32),
+            np.ascontiguousarray(im_1, dtype=np.float32),
+            np.ascontiguousarray(im_2, dtype=np.float32),
+            np.float32(im_0_min),
+            np.float32(inv_0),
+            np.float32(im_1_min),
+            np.float32(inv_1),
+            np.float32(im_2_min),
+            np.float32(inv_2),
+            im_rgb,
+        )
+        if out_dtype is None:
+            im_rgb /= np.array(max_rgb, dtype=np.float32)
+            return im_rgb
+
+        # Fold normalization and 8-bit scaling into one multiply
+        im_rgb *= np.float32(255.0) / np.array(max_rgb, dtype=np.float32)
+        im_rgb += np.float32(0.5)
+        return im_rgb.astype(np.uint8)
+
+    # Scale the images in-place in float32 to avoid intermediate temporaries
     if im_0_max > im_0_min:
-        im_0 = (im_0 - im_0_min) / (im_0_max - im_0_min)
+        im_0 = np.subtract(im_0, im_0_min, dtype=np.float32)
+        im_0 *= np.float32(1.0 / (im_0_max - im_0_min))
     else:
-        im_0 = (im_0 > 0).astype(float)
+        im_0 = (im_0 > 0).astype(np.float32)
 
     if im_1_max > im_1_min:
-        im_1 = (im_1 - im_1_min) / (im_1_max - im_1_min)
+        im_1 = np.subtract(im_1, im_1_min, dtype=np.float32)
+        im_1 *= np.float32(1.0 / (im_1_max - im_1_min))
     else:
-        im_0 = (im_0 > 0).astype(float)
+        im_1 = (im_1 > 0).astype(np.float32)
 
     if im_2 is None:
         im_2 = np.zeros_like(im_0)
     elif im_2_max > im_2_min:
-        im_2 = (im_2 - im_2_min) / (im_2_max - im_2_min)
+        im_2 = np.subtract(im_2, im_2_min, dtype=np.float32)
+        im_2 *= np.float32(1.0 / (im_2_max - im_2_min))
     else:
-        im_0 = (im_0 > 0).astype(float)
+        im_2 = (im_2 > 0).astype(np.float32)
 
     # Convert images to RGB
     if cmy:
-        im_c = np.stack((np.zeros_like(im_0), im_0, im_0), axis=2)
-        im_m = np.stack((im_1, np.zeros_like(im_1), im_1), axis=2)
-        im_y = np.stack((im_2, im_2, np.zeros_like(im_2)), axis=2)
-        im_rgb = im_c + im_m + im_y
-        for i in [0, 1, 2]:
-            im_rgb[:, :, i] /= im_rgb[:, :, i].max()
+        # Write the channel sums directly into a preallocated output
+        im_rgb = np.empty((*im_0.shape, 3), dtype=np.float32)
+        np.add(im_1, im_2, out=im_rgb[:, :, 0])
+        np.add(im_0, im_2, out=im_rgb[:, :, 1])
+        np.add(im_0, im_1, out=im_rgb[:, :, 2])
+        np.divide(im_rgb, im_rgb.max(axis=(0, 1), keepdims=True), out=im_rgb)
     else:
-        im_rgb = np.empty((*im_0.shape, 3))
+        im_rgb = np.empty((*im_0.shape, 3), dtype=np.float32)
         im_rgb[:, :, 0] = im_0
         im_rgb[:, :, 1] = im_1
         im_rgb[:, :, 2] = im_2
 
+    # Quantize to 8 bits if requested
+    if out_dtype is not None:
+        im_rgb *= np.float32(255.0)
+        im_rgb += np.float32(0.5)
+        im_rgb = im_rgb.astype(np.uint8)
+
     return im_rgb
 
 
@@ -372,7 +554,8 @@ def rgb_to_rgba32(im, flip=True):
     Parameters
     ----------
     im : ndarray, shape (nrows, ncolums, 3)
-        Input image. All pixel values must be between 0 and 1.
+        Input image. All pixel values must be between 0 and 1, unless
+        the image is 8-bit, in which case it is packed as-is.
     flip : bool, default True
         If True, flip image so it displays right-side up. This is
         necessary because traditionally images have their 0,0 pixel
@@ -387,28 +570,46 @@ def rgb_to_rgba32(im, flip=True):
     if im.ndim != 3 or im.shape[2] != 3:
         raise RuntimeError("Input image is not RGB.")
 
-    # Make sure all entries between zero and one
-    if (im < 0).any() or (im > 1).any():
-        raise RuntimeError("All pixel values must be between 0 and 1.")
-
     # Get image shape
     n, m, _ = im.shape
 
-    # Convert to 8-bit, which is expected for viewing
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        im_8 = skimage.img_as_ubyte(im)
-
-    # Add the alpha channel, which is expected by Bokeh
-    im_rgba = np.stack(
-        (*np.rollaxis(im_8, 2), 255 * np.ones((n, m), dtype=np.uint8)), axis=2
-    )
-
-    # Reshape into 32 bit. Must flip up/down for proper orientation
+    if im.dtype == np.uint8:
+        # Already display-scaled; pack directly
+        im_8 = im
+    else:
+        # Make sure all entries between zero and one; one scan, no
+        # boolean-mask temporaries
+        im_min, im_max = _minmax(im)
+        if im_min < 0 or im_max > 1:
+            raise RuntimeError("All pixel values must be between 0 and 1.")
+
+        # Fused kernel reads each pixel triplet once, writes one uint32
+        if _NUMBA_AVAILABLE:
+            im_rgba = np.empty((n, m), dtype=np.uint32)
+            if flip:
+                _rgba32_kernel(np.asarray(im, dtype=np.float32), im_rgba, n - 1, -1)
+            else:
+                _rgba32_kernel(np.asarray(im, dtype=np.float32), im_rgba, 0, 1)
+            return im_rgba
+
+        # Convert to 8-bit, which is expected for viewing
+        im_8 = np.multiply(im, 255.0)
+        im_8 += 0.5
+        im_8 = im_8.astype(np.uint8)
+
+    # Bit-pack into 32-bit with opaque alpha, the little-endian ABGR
+    # layout expected by Bokeh; avoids stacking an alpha channel
+    im_rgba = np.empty((n, m), dtype=np.uint32)
+    np.left_shift(im_8[:, :, 2].astype(np.uint32), 16, out=im_rgba)
+    im_rgba |= im_8[:, :, 1].astype(np.uint32) << 8
+    im_rgba |= im_8[:, :, 0]
+    im_rgba |= np.uint32(0xFF000000)
+
+    # Must flip up/down for proper orientation (stride view, no copy)
     if flip:
-        return np.flipud(im_rgba.view(dtype=np.int32).reshape((n, m)))
+        return im_rgba[::-1]
     else:
-        return im_rgba.view(dtype=np.int32).reshape((n, m))
+        return im_rgba
 
 
 def rgb_frac_to_hex(rgb_frac):
@@ -437,14 +638,50 @@ def rgb_frac_to_hex(rgb_frac):
     if len(rgb_frac) != 3:
         raise RuntimeError("`rgb_frac` must have exactly three entries.")
 
-    if (np.array(rgb_frac) < 0).any() or (np.array(rgb_frac) > 1).any():
+    if any(x < 0 or x > 1 for x in rgb_frac):
         raise RuntimeError("RGB values must be between 0 and 1.")
 
-    return "#{0:02x}{1:02x}{2:02x}".format(
-        int(rgb_frac[0] * 255), int(rgb_frac[1] * 255), int(rgb_frac[2] * 255)
+    return (
+        "#"
+        + _HEX[int(rgb_frac[0] * 255)]
+        + _HEX[int(rgb_frac[1] * 255)]
+        + _HEX[int(rgb_frac[2] * 255)]
     )
 
 
+def rgb_frac_to_hex_batch(rgb_frac):
+    """
+    Convert an array of fractional RGB values to hexidecimal strings.
+
+    Parameters
+    ----------
+    rgb_frac : array_like, shape (n, 3)
+        Fractional RGB values; each entry is between 0 and 1.
+
+    Returns
+    -------
+    list of str
+        Hexidecimal strings for the given RGB colors.
+
+    Examples
+    --------
+    >>> rgb_frac_to_hex_batch([[0.65, 0.23, 1.0], [1.0, 1.0, 1.0]])
+    ['#a53aff', '#ffffff']
+    """
+
+    rgb_frac = np.asarray(rgb_frac)
+
+    if rgb_frac.ndim != 2 or rgb_frac.shape[1] != 3:
+        raise RuntimeError("`rgb_frac` must have shape (n, 3).")
+
+    if rgb_frac.size > 0 and (rgb_frac.min() < 0 or rgb_frac.max() > 1):
+        raise RuntimeError("RGB values must be between 0 and 1.")
+
+    rgb_8 = np.multiply(rgb_frac, 255.0).astype(np.uint8)
+
+    return ["#" + _HEX[r] + _HEX[g] + _HEX[b] for r, g, b in rgb_8]
+
+
 def _display_clicks(div, attributes=[], style="float:left;clear:left;font_size=0.5pt"):
     """Build a suitable CustomJS to display the current event
     in the div model."""